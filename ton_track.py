@@ -1,50 +1,459 @@
 import asyncio
+import collections
+import hashlib
+import logging
+import logging.handlers
+import operator
+import queue
+import aiohttp
+import orjson
 import websockets
-import json
-import requests
+import random
+import sys
 import time
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+_SCALE = 1e-9  # Nanotons to TON
+_OFFLOAD_JSON_BYTES = 8192  # Bodies larger than this are decoded in a worker thread
+
+def _n2t(value) -> float:
+    """Convert a nanoton amount (int or numeric string) to TON"""
+    return 0.0 if not value else int(value) * _SCALE
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff capped at 60s, with jitter to spread out reconnects"""
+    return min(60, (2 ** min(attempt, 7)) * 0.5) + random.uniform(0, 1)
+
+async def _decode_json(body: bytes):
+    """Decode a JSON body, moving large ones off the event loop"""
+    if len(body) > _OFFLOAD_JSON_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(None, orjson.loads, body)
+    return orjson.loads(body)
+
+# Callers own the returned listener and pass it to stop_logging at exit;
+# start_monitoring sets this up itself when no logging is configured
+def setup_logging() -> logging.handlers.QueueListener:
+    """Route log records through a queue so stdout writes happen off the event loop"""
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
+
+def stop_logging(listener: logging.handlers.QueueListener):
+    """Flush the queue listener and detach its handler from the root logger"""
+    listener.stop()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+            root.removeHandler(handler)
 
 class TONWalletTracker:
-    def __init__(self, wallet_address: str):
-        self.wallet_address = wallet_address
-        self.last_lt = None  # Last logical time to track new transactions
-        self.processed_hashes = set()  # To avoid duplicate processing
+    # Process-wide HTTP session shared by every tracker, created lazily inside the running event loop
+    _session: Optional[aiohttp.ClientSession] = None
+
+    def __init__(self, wallets: List[str]):
+        self.wallets = list(wallets)
+        # Per-wallet last logical time to track new transactions
+        self.last_lt: Dict[str, Optional[str]] = {wallet: None for wallet in self.wallets}
+        self._last_lt_int: Dict[str, int] = {wallet: -1 for wallet in self.wallets}  # Parsed copies of last_lt
+        # Per-wallet bounded LRU of processed hashes to avoid duplicates
+        self._seen: Dict[str, collections.OrderedDict] = {
+            wallet: collections.OrderedDict() for wallet in self.wallets
+        }
+        self._seen_capacity = 10_000
 
         # TON API endpoints
         self.api_base = "https://toncenter.com/api/v2"
         self.websocket_url = "wss://tonapi.io/v2/websocket"
-
-    def get_transactions_history(self, limit: int = 10) -> List[Dict]:
-        """Get recent transactions for the wallet"""
+        self.sse_url = "https://tonapi.io/v2/sse/accounts/transactions"
+        # Seconds to wait for stream activity before polling anyway; websocket covers latency
+        self.long_poll_timeout = 30
+
+        # Persistent SSE stream; the listener flags transaction events for the polling loop
+        self._tx_event = asyncio.Event()
+        self._sse_task: Optional[asyncio.Task] = None
+        self.batch_size = 10  # Max wallets per JSON-RPC batch
+        self._batch_supported = True  # Cleared once the server rejects batched JSON-RPC
+        self.batch_window = 0.075  # Seconds to collect concurrent fetches into one batch
+
+        # Pending (wallet, limit, to_lt, allow_unchanged, future) fetches, drained by _batcher
+        self._poll_queue: asyncio.Queue = asyncio.Queue()
+        self._batcher_task: Optional[asyncio.Task] = None
+
+        # Bounded LRU of ("etag" | "digest", value) validators per request, for skipping unchanged
+        # responses. New validators stay pending per wallet until that wallet's result is processed.
+        self._validators: collections.OrderedDict = collections.OrderedDict()
+        self._validator_capacity = 1024
+        self._pending_validators: Dict[str, Dict[Tuple, Tuple[str, object]]] = {}
+
+        # Adaptive getTransactions page size: small while idle, widened during bursts
+        self._poll_limit = 3
+        self._min_poll_limit = 3
+        self._max_poll_limit = 50
+
+    @classmethod
+    def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared keep-alive HTTP session, creating it on first use"""
+        if cls._session is None or cls._session.closed:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=8)
+            )
+        return cls._session
+
+    @classmethod
+    async def shutdown(cls):
+        """Close the shared HTTP session"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+
+    async def close(self):
+        """Cancel this tracker's background SSE listener and batcher tasks"""
+        tasks = [task for task in (self._sse_task, self._batcher_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._sse_task = None
+        self._batcher_task = None
+
+    def _mark_seen(self, wallet: str, tx_hash: str):
+        """Record a processed hash, evicting the oldest once over capacity"""
+        seen = self._seen[wallet]
+        seen[tx_hash] = None
+        seen.move_to_end(tx_hash)
+        if len(seen) > self._seen_capacity:
+            seen.popitem(last=False)
+
+    def _set_last_lt(self, wallet: str, lt: str, lt_int: Optional[int] = None):
+        """Update a wallet's last_lt together with its cached integer value"""
+        self.last_lt[wallet] = lt
+        self._last_lt_int[wallet] = int(lt) if lt_int is None else lt_int
+
+    def _is_seen(self, wallet: str, tx_hash: str) -> bool:
+        """Check whether a hash has already been processed for a wallet"""
+        return tx_hash in self._seen[wallet]
+
+    def _remember_validator(self, wallets: List[str], key: Tuple, validator: Tuple[str, object]):
+        """Hold a request's validator until its result has been processed for the wallets"""
+        for wallet in wallets:
+            self._pending_validators.setdefault(wallet, {})[key] = validator
+
+    def _commit_validators(self, wallet: str):
+        """Make a wallet's pending validators usable once its result has been processed"""
+        for key, validator in self._pending_validators.pop(wallet, {}).items():
+            self._validators[key] = validator
+            self._validators.move_to_end(key)
+            if len(self._validators) > self._validator_capacity:
+                self._validators.popitem(last=False)
+
+    async def get_transactions_history(
+        self,
+        address: str,
+        limit: int = 10,
+        to_lt: int = 0,
+        allow_unchanged: bool = True
+    ) -> Optional[List[Dict]]:
+        """Get recent transactions for a single wallet; None if unchanged since last processed"""
         url = f"{self.api_base}/getTransactions"
         params = {
-            "address": self.wallet_address,
+            "address": address,
             "limit": limit,
-            "to_lt": 0,
+            "to_lt": to_lt,
             "archival": "true"
         }
 
+        key = ("get", address, limit, to_lt)
+        validator = self._validators.get(key) if allow_unchanged else None
+        headers = {}
+        if validator and validator[0] == "etag":
+            headers["If-None-Match"] = validator[1]
+
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            async with self._get_session().get(url, params=params, headers=headers) as response:
+                if response.status == 304:
+                    return None
+                response.raise_for_status()
+                body = await response.read()
+                etag = response.headers.get("ETag")
+
+            # Skip decoding entirely when the body matches the last processed one
+            if etag:
+                new_validator = ("etag", etag)
+            else:
+                new_validator = ("digest", hashlib.blake2b(body, digest_size=8).digest())
+                if new_validator == validator:
+                    return None
 
+            data = await _decode_json(body)
             if data.get("ok"):
+                # Only successful results may be skipped later; repeated errors must keep being reported
+                self._remember_validator([address], key, new_validator)
                 return data.get("result", [])
             else:
-                print(f"API Error: {data.get('error', 'Unknown error')}")
+                log.error(f"API Error: {data.get('error', 'Unknown error')}")
                 return []
 
-        except requests.RequestException as e:
-            print(f"Request error: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            log.error(f"Request error: {e}")
             return []
 
+    async def get_transactions_batch(
+        self,
+        addresses: List[str],
+        limit: int = 10,
+        to_lts: Optional[Dict[str, int]] = None,
+        limits: Optional[Dict[str, int]] = None,
+        allow_unchanged: bool = True
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """Get recent transactions for several wallets, batching up to batch_size per request"""
+        results: Dict[str, Optional[List[Dict]]] = {}
+        # Per-wallet server-side stop LT and page size; unchanged responses map to None
+        to_lts = {address: max(0, (to_lts or {}).get(address, 0)) for address in addresses}
+        limits = {address: (limits or {}).get(address, limit) for address in addresses}
+
+        for start in range(0, len(addresses), self.batch_size):
+            chunk = addresses[start:start + self.batch_size]
+
+            batch = None
+            if len(chunk) > 1 and self._batch_supported:
+                batch = await self._post_batch(chunk, limits, to_lts, allow_unchanged)
+
+            if batch is None:
+                # Single wallet, batching unsupported or batch failed - fall back to parallel requests
+                histories = await asyncio.gather(
+                    *(
+                        self.get_transactions_history(
+                            address, limit=limits[address], to_lt=to_lts[address], allow_unchanged=allow_unchanged
+                        )
+                        for address in chunk
+                    )
+                )
+                batch = dict(zip(chunk, histories))
+
+            results.update(batch)
+
+        return results
+
+    async def _post_batch(
+        self,
+        addresses: List[str],
+        limits: Dict[str, int],
+        to_lts: Dict[str, int],
+        allow_unchanged: bool = True
+    ) -> Optional[Dict[str, Optional[List[Dict]]]]:
+        """Send one JSON-RPC batch of getTransactions calls; None if it fails"""
+        url = f"{self.api_base}/jsonRPC"
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getTransactions",
+                "params": {
+                    "address": address,
+                    "limit": limits[address],
+                    "to_lt": to_lts[address],
+                    "archival": True
+                }
+            }
+            for i, address in enumerate(addresses)
+        ]
+
+        try:
+            async with self._get_session().post(
+                url,
+                data=orjson.dumps(payload),
+                headers={"Content-Type": "application/json"}
+            ) as response:
+                response.raise_for_status()
+                body = await response.read()
+
+            key = ("batch",) + tuple((address, limits[address], to_lts[address]) for address in addresses)
+            validator = ("digest", hashlib.blake2b(body, digest_size=8).digest())
+            if allow_unchanged and self._validators.get(key) == validator:
+                return {address: None for address in addresses}
+
+            data = await _decode_json(body)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 429:
+                # Rate limited - skip this round rather than fanning out into single requests
+                log.error(f"Batch request rate limited: {e}")
+                return {address: None for address in addresses}
+            # Any other 4xx means the array payload itself was refused
+            if 400 <= e.status < 500:
+                self._disable_batching(f"HTTP {e.status}")
+            else:
+                log.error(f"Batch request error: {e}")
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            log.error(f"Batch request error: {e}")
+            return None
+
+        if not isinstance(data, list):
+            self._disable_batching("reply is not a JSON-RPC array")
+            return None
+
+        # Reassemble results by request id
+        results: Dict[str, Optional[List[Dict]]] = {address: [] for address in addresses}
+        ok_addresses = set()
+        for item in data:
+            index = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(index, int) or not 0 <= index < len(addresses):
+                continue
+            if item.get("ok"):
+                results[addresses[index]] = item.get("result", [])
+                ok_addresses.add(addresses[index])
+            else:
+                log.error(f"API Error ({addresses[index]}): {item.get('error', 'Unknown error')}")
+
+        # Only a fully successful batch may be skipped later
+        if len(ok_addresses) == len(addresses):
+            self._remember_validator(addresses, key, validator)
+
+        return results
+
+    def _disable_batching(self, reason: str):
+        """Stop sending JSON-RPC batches and use parallel single requests from now on"""
+        self._batch_supported = False
+        log.warning(f"⚠️  JSON-RPC batching rejected ({reason}), using single requests")
+
+    def _ensure_batcher(self):
+        """Start the background batcher if it is not running"""
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = asyncio.create_task(self._batcher())
+
+    async def _batcher(self):
+        """Collect fetches queued within batch_window and serve them with one batched RPC"""
+        while True:
+            pending: List[Tuple[str, int, int, bool, asyncio.Future]] = [await self._poll_queue.get()]
+
+            # Give concurrent callers a moment to join, but only when a batched RPC is possible
+            if len(self.wallets) > 1 and self._batch_supported:
+                await asyncio.sleep(self.batch_window)
+            # Drain everything; get_transactions_batch already splits into batch_size chunks
+            while not self._poll_queue.empty():
+                pending.append(self._poll_queue.get_nowait())
+
+            # Coalesce duplicate wallets: the widest request covers the others
+            limits: Dict[str, int] = {}
+            to_lts: Dict[str, int] = {}
+            for wallet, limit, to_lt, _, _ in pending:
+                limits[wallet] = max(limit, limits.get(wallet, 0))
+                to_lts[wallet] = min(to_lt, to_lts.get(wallet, to_lt))
+            # Any caller that needs the full data gets it for the whole batch
+            allow_unchanged = all(item[3] for item in pending)
+
+            try:
+                results = await self.get_transactions_batch(
+                    list(limits), to_lts=to_lts, limits=limits, allow_unchanged=allow_unchanged
+                )
+            except Exception as e:
+                for *_, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for wallet, _, _, _, future in pending:
+                if not future.done():
+                    future.set_result(results.get(wallet, []))
+
+    async def _fetch_transactions(
+        self,
+        wallet: str,
+        limit: int = 10,
+        to_lt: int = 0,
+        allow_unchanged: bool = True
+    ) -> Optional[List[Dict]]:
+        """Queue a fetch for one wallet and wait for the batched result (None if unchanged)"""
+        self._ensure_batcher()
+        future = asyncio.get_running_loop().create_future()
+        await self._poll_queue.put((wallet, limit, to_lt, allow_unchanged, future))
+        return await future
+
+    async def _fetch_all(
+        self,
+        limit: int = 10,
+        to_lts: Optional[Dict[str, int]] = None,
+        allow_unchanged: bool = True
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """Fetch every tracked wallet through the batcher"""
+        to_lts = to_lts or {}
+        histories = await asyncio.gather(
+            *(
+                self._fetch_transactions(
+                    wallet, limit=limit, to_lt=to_lts.get(wallet, 0), allow_unchanged=allow_unchanged
+                )
+                for wallet in self.wallets
+            )
+        )
+        return dict(zip(self.wallets, histories))
+
+    def _ensure_sse_listener(self):
+        """Start the background SSE listener if it is not running"""
+        if self._sse_task is None or self._sse_task.done():
+            self._sse_task = asyncio.create_task(self._sse_listener())
+
+    async def _long_poll(self):
+        """Wait until a tracked wallet sees a new transaction or the hold window expires"""
+        self._ensure_sse_listener()
+        try:
+            await asyncio.wait_for(self._tx_event.wait(), timeout=self.long_poll_timeout)
+        except asyncio.TimeoutError:
+            return
+
+        # Clear before fetching so events arriving during the fetch trigger the next one
+        self._tx_event.clear()
+
+    async def _sse_listener(self):
+        """Keep one tonapi.io SSE stream open across polls, reconnecting with backoff"""
+        params = {"accounts": ",".join(self.wallets)}
+        # No total limit for a streaming response; a silent stream is treated as dead
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=8, sock_read=self.long_poll_timeout * 2)
+        loop = asyncio.get_running_loop()
+        attempt = 0
+
+        while True:
+            opened_at = loop.time()
+            try:
+                async with self._get_session().get(self.sse_url, params=params, timeout=timeout) as response:
+                    response.raise_for_status()
+                    async for line in response.content:
+                        if not line.startswith(b"data:"):
+                            continue
+                        try:
+                            event = orjson.loads(line[5:])
+                        except orjson.JSONDecodeError:
+                            continue
+                        if isinstance(event, dict) and event.get("tx_hash"):
+                            self._tx_event.set()
+                log.error("❌ Long-poll stream closed")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                log.error(f"❌ Long-poll error: {e}")
+
+            # Only a stream that stayed up for a full window restarts the backoff schedule
+            if loop.time() - opened_at >= self.long_poll_timeout:
+                attempt = 0
+
+            # Stream is down - have the polling loop check directly, then reconnect
+            self._tx_event.set()
+            await asyncio.sleep(_backoff_delay(attempt))
+            attempt += 1
+
     def format_transaction(self, tx: Dict) -> str:
         """Format transaction for display"""
         utime = tx.get("utime", 0)
-        timestamp = datetime.fromtimestamp(utime).strftime("%Y-%m-%d %H:%M:%S")
+        t = time.gmtime(utime)
+        timestamp = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
 
         tx_hash = tx.get("transaction_id", {}).get("hash", "N/A")
         lt = tx.get("transaction_id", {}).get("lt", "N/A")
@@ -53,100 +462,133 @@ class TONWalletTracker:
         in_msg = tx.get("in_msg", {})
         out_msgs = tx.get("out_msgs", [])
 
+        parts = [
+            "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n",
+            f"📅 Time: {timestamp} UTC\n",
+            f"🔗 Hash: {tx_hash}\n",
+            f"📊 LT: {lt}\n",
+            f"💰 Fees: {_n2t(tx.get('total_fees')):.6f} TON\n",
+        ]
+
         # Format incoming message
-        incoming_value = 0
-        incoming_source = "N/A"
         if in_msg and in_msg.get("value"):
-            incoming_value = int(in_msg.get("value", 0)) / 1e9  # Convert from nanotons to TON
-            incoming_source = in_msg.get("source", "N/A")
+            incoming_value = _n2t(in_msg["value"])
+            if incoming_value > 0:
+                parts.append(f"📥 INCOMING: {incoming_value:.6f} TON from {in_msg.get('source', 'N/A')}\n")
 
         # Format outgoing messages
-        outgoing_info = []
-        for out_msg in out_msgs:
-            if out_msg.get("value"):
-                value = int(out_msg.get("value", 0)) / 1e9
-                destination = out_msg.get("destination", "N/A")
-                outgoing_info.append(f"  → {destination}: {value:.6f} TON")
-
-        # Transaction fees
-        total_fees = int(tx.get("total_fees", 0)) / 1e9
-
-        result = f"""
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-📅 Time: {timestamp}
-🔗 Hash: {tx_hash}
-📊 LT: {lt}
-💰 Fees: {total_fees:.6f} TON
-"""
-
-        if incoming_value > 0:
-            result += f"📥 INCOMING: {incoming_value:.6f} TON from {incoming_source}\n"
-
-        if outgoing_info:
-            result += "📤 OUTGOING:\n" + "\n".join(outgoing_info) + "\n"
-
-        return result
+        outgoing = [m for m in out_msgs if m.get("value")]
+        if outgoing:
+            parts.append("📤 OUTGOING:\n")
+            parts.extend(
+                "  → %s: %.6f TON\n" % (m.get("destination", "N/A"), _n2t(m["value"]))
+                for m in outgoing
+            )
+
+        return "".join(parts)
+
+    def _is_full_page(self, wallet: str, transactions: Optional[List[Dict]], limit: int) -> bool:
+        """Check whether a page is entirely newer than last_lt, so older new transactions may be cut off"""
+        if transactions is None or len(transactions) < limit:
+            return False
+        last_lt_int = self._last_lt_int[wallet]
+        return all(int(tx["transaction_id"]["lt"]) > last_lt_int for tx in transactions)
+
+    async def _fetch_new(self, limit: int) -> Tuple[Dict[str, Optional[List[Dict]]], int]:
+        """Fetch transactions newer than each wallet's last LT; returns the batch and the page size used"""
+        batch = await self._fetch_all(limit=limit, to_lts=self._last_lt_int)
+
+        # A full page of new transactions may hide a gap - widen and re-fetch before processing
+        while (limit < self._max_poll_limit and
+               any(self._is_full_page(wallet, txs, limit) for wallet, txs in batch.items())):
+            limit = min(self._max_poll_limit, limit * 2)
+            # Must see the real page: an "unchanged" answer here would hide the overflow
+            batch = await self._fetch_all(limit=limit, to_lts=self._last_lt_int, allow_unchanged=False)
+
+        return batch, limit
+
+    def _process_batch(self, wallet: str, transactions: Optional[List[Dict]]) -> int:
+        """Report a wallet's unseen transactions newer than its last_lt; returns how many"""
+        # None means the response was unchanged, so there is nothing to scan
+        if transactions is None:
+            return 0
+
+        new_count = self._report_new(wallet, transactions)
+        # Only now that the result is handled may its validators skip identical responses
+        self._commit_validators(wallet)
+        return new_count
+
+    def _report_new(self, wallet: str, transactions: List[Dict]) -> int:
+        """Log unseen transactions newer than last_lt in LT order and advance last_lt"""
+        last_lt_int = self._last_lt_int[wallet]
+
+        # Walk each transaction once and keep (lt, hash, tx) so nothing is re-parsed later
+        new_transactions = []
+        for tx in transactions:
+            tid = tx.get("transaction_id")
+            if not tid:
+                continue
+            tx_hash = tid.get("hash")
+            if not tx_hash or self._is_seen(wallet, tx_hash):
+                continue
+            lt_int = int(tid["lt"])
+            if lt_int > last_lt_int:
+                new_transactions.append((lt_int, tx_hash, tx))
+
+        if not new_transactions:
+            return 0
+
+        # Process new transactions (oldest first)
+        new_transactions.sort(key=operator.itemgetter(0))
+
+        for _, tx_hash, tx in new_transactions:
+            self._mark_seen(wallet, tx_hash)
+            log.info(f"🚨 NEW TRANSACTION DETECTED! Wallet: {wallet}\n{self.format_transaction(tx)}")
+
+        # Sorted ascending, so the last one carries the highest LT
+        lt_int, _, tx = new_transactions[-1]
+        self._set_last_lt(wallet, tx["transaction_id"]["lt"], lt_int)
+
+        return len(new_transactions)
 
     async def check_new_transactions(self):
-        """Check for new transactions periodically"""
-        print(f"🔍 Checking for new transactions on wallet: {self.wallet_address}")
+        """Check for new transactions on stream activity, and at least every long_poll_timeout seconds"""
+        log.info(f"🔍 Checking for new transactions on {len(self.wallets)} wallet(s)")
 
-        # Get initial transactions to set baseline
-        initial_txs = self.get_transactions_history(limit=1)
-        if initial_txs:
-            self.last_lt = initial_txs[0].get("transaction_id", {}).get("lt")
-            for tx in initial_txs:
-                tx_hash = tx.get("transaction_id", {}).get("hash")
-                if tx_hash:
-                    self.processed_hashes.add(tx_hash)
+        # start_monitoring sets the baseline via check_single_update; only fetch it when run standalone
+        if all(lt is None for lt in self.last_lt.values()):
+            await self.check_single_update()
 
-        print(f"✅ Monitoring started. Last LT: {self.last_lt}")
-        print("=" * 60)
+        for wallet in self.wallets:
+            log.info(f"✅ Monitoring started for {wallet}. Last LT: {self.last_lt[wallet]}")
+        log.info("=" * 60)
 
         while True:
             try:
-                # Get recent transactions
-                transactions = self.get_transactions_history(limit=20)
+                # Wait for stream activity; a quiet window still polls, covering websocket and stream gaps
+                await self._long_poll()
 
-                new_transactions = []
-                for tx in transactions:
-                    tx_hash = tx.get("transaction_id", {}).get("hash")
-                    tx_lt = tx.get("transaction_id", {}).get("lt")
+                batch, self._poll_limit = await self._fetch_new(self._poll_limit)
 
-                    # Check if this is a new transaction
-                    if (tx_hash and tx_hash not in self.processed_hashes and
-                        (self.last_lt is None or int(tx_lt) > int(self.last_lt))):
-                        new_transactions.append(tx)
-                        self.processed_hashes.add(tx_hash)
+                new_count = 0
+                for wallet, transactions in batch.items():
+                    new_count += self._process_batch(wallet, transactions)
 
-                # Process new transactions (newest first)
-                if new_transactions:
-                    new_transactions.sort(key=lambda x: int(x.get("transaction_id", {}).get("lt", 0)))
-
-                    for tx in new_transactions:
-                        print("🚨 NEW TRANSACTION DETECTED!")
-                        print(self.format_transaction(tx))
-
-                        # Update last_lt
-                        tx_lt = tx.get("transaction_id", {}).get("lt")
-                        if tx_lt and (self.last_lt is None or int(tx_lt) > int(self.last_lt)):
-                            self.last_lt = tx_lt
-
-                # Wait before next check
-                await asyncio.sleep(5)  # Check every 5 seconds
+                # Shrink the page again once polls come back idle
+                if new_count == 0:
+                    self._poll_limit = max(self._min_poll_limit, self._poll_limit // 2)
 
             except Exception as e:
-                print(f"❌ Error checking transactions: {e}")
+                log.error(f"❌ Error checking transactions: {e}")
                 await asyncio.sleep(10)  # Wait longer on error
 
     async def websocket_monitor(self):
-        """Monitor transactions via websocket (alternative method)"""
-        retry_count = 0
-        max_retries = 3
+        """Monitor transactions via websocket, reconnecting with exponential backoff"""
+        attempt = 0
 
-        while retry_count < max_retries:
+        while True:
             try:
-                print(f"🔌 Attempting websocket connection (attempt {retry_count + 1}/{max_retries})...")
+                log.info(f"🔌 Attempting websocket connection (attempt {attempt + 1})...")
 
                 # Use a more reliable websocket endpoint
                 ws_url = "wss://scaleton.io/ws"
@@ -157,7 +599,7 @@ class TONWalletTracker:
                     "jsonrpc": "2.0",
                     "method": "subscribe",
                     "params": {
-                        "accounts": [self.wallet_address]
+                        "accounts": self.wallets
                     }
                 }
 
@@ -167,112 +609,115 @@ class TONWalletTracker:
                     ping_timeout=10,
                     close_timeout=10
                 ) as websocket:
-                    print("✅ Websocket connected!")
+                    log.info("✅ Websocket connected!")
 
                     # Send subscription
-                    await websocket.send(json.dumps(subscribe_message))
-                    print("📡 Subscription sent")
+                    await websocket.send(orjson.dumps(subscribe_message).decode())
+                    log.info("📡 Subscription sent")
 
                     # Listen for messages with timeout
                     try:
                         async for message in websocket:
+                            # The connection is healthy again, so restart the backoff schedule
+                            attempt = 0
                             try:
-                                data = json.loads(message)
-                                print(f"📨 Websocket message: {data}")
+                                data = orjson.loads(message)
+                                log.info(f"📨 Websocket message: {data}")
 
                                 # Process websocket data here
                                 if data.get("method") == "account_update":
-                                    print("🔄 Account update received, checking for new transactions...")
+                                    log.info("🔄 Account update received, checking for new transactions...")
                                     # Trigger a transaction check
                                     await self.check_single_update()
 
-                            except json.JSONDecodeError as e:
-                                print(f"❌ JSON decode error: {e}")
+                            except orjson.JSONDecodeError as e:
+                                log.error(f"❌ JSON decode error: {e}")
 
                     except websockets.exceptions.ConnectionClosed:
-                        print("🔌 Websocket connection closed")
+                        log.info("🔌 Websocket connection closed")
                         raise
 
             except Exception as e:
-                print(f"❌ Websocket error: {e}")
-                retry_count += 1
-                if retry_count < max_retries:
-                    print(f"🔄 Retrying in 5 seconds...")
-                    await asyncio.sleep(5)
-                else:
-                    print("🔄 Max retries reached, falling back to polling method...")
-                    raise
+                log.error(f"❌ Websocket error: {e}")
+
+            delay = _backoff_delay(attempt)
+            attempt += 1
+            log.info(f"🔄 Reconnecting in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
 
     async def check_single_update(self):
         """Check for new transactions once"""
         try:
-            transactions = self.get_transactions_history(limit=5)
-
-            new_transactions = []
-            for tx in transactions:
-                tx_hash = tx.get("transaction_id", {}).get("hash")
-                tx_lt = tx.get("transaction_id", {}).get("lt")
-
-                if (tx_hash and tx_hash not in self.processed_hashes and
-                    (self.last_lt is None or int(tx_lt) > int(self.last_lt))):
-                    new_transactions.append(tx)
-                    self.processed_hashes.add(tx_hash)
+            batch, _ = await self._fetch_new(5)
 
-            if new_transactions:
-                new_transactions.sort(key=lambda x: int(x.get("transaction_id", {}).get("lt", 0)))
-
-                for tx in new_transactions:
-                    print("🚨 NEW TRANSACTION DETECTED!")
-                    print(self.format_transaction(tx))
-
-                    tx_lt = tx.get("transaction_id", {}).get("lt")
-                    if tx_lt and (self.last_lt is None or int(tx_lt) > int(self.last_lt)):
-                        self.last_lt = tx_lt
+            for wallet, transactions in batch.items():
+                self._process_batch(wallet, transactions)
 
         except Exception as e:
-            print(f"❌ Error in single update check: {e}")
+            log.error(f"❌ Error in single update check: {e}")
 
     async def start_monitoring(self):
-        """Start monitoring with improved fallback methods"""
-        print("🚀 Starting TON Wallet Transaction Tracker")
-        print(f"👛 Wallet: {self.wallet_address}")
-        print("=" * 60)
+        """Start monitoring with websocket and polling running concurrently"""
+        # Alerts are INFO records; make sure they are shown when the caller set up no logging
+        listener = None if log.hasHandlers() else setup_logging()
+        try:
+            await self._monitor()
+        finally:
+            # Stop background tasks before the shared session they use is shut down
+            await self.close()
+            if listener is not None:
+                stop_logging(listener)
+
+    async def _monitor(self):
+        """Initialize the baseline, then run the websocket and polling monitors"""
+        log.info("🚀 Starting TON Wallet Transaction Tracker")
+        for wallet in self.wallets:
+            log.info(f"👛 Wallet: {wallet}")
+        log.info("=" * 60)
 
         # Initialize with recent transactions
-        print("🔄 Initializing with recent transactions...")
+        log.info("🔄 Initializing with recent transactions...")
         await self.check_single_update()
 
-        # Try websocket with shorter timeout, then use polling
-        try:
-            await asyncio.wait_for(self.websocket_monitor(), timeout=10)
-        except (asyncio.TimeoutError, Exception) as e:
-            if not isinstance(e, asyncio.TimeoutError):
-                print(f"⚠️  Websocket failed: {e}")
-            print("🔄 Using reliable polling method...")
-            await self.check_new_transactions()
+        # Websocket drives low-latency alerts, polling is the safety net; _seen deduplicates
+        results = await asyncio.gather(
+            self.websocket_monitor(),
+            self.check_new_transactions(),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.warning(f"⚠️  Monitor stopped: {result}")
 
 async def main():
-    # The wallet address you provided
-    wallet_address = "UQBfuEnLEUF8JEbXpknjmxGqeZsNR2CX9MIJfZVi99M1OCEF"
+    # The wallet addresses to track
+    wallets = ["UQBfuEnLEUF8JEbXpknjmxGqeZsNR2CX9MIJfZVi99M1OCEF"]
 
     # Create tracker instance
-    tracker = TONWalletTracker(wallet_address)
+    tracker = TONWalletTracker(wallets)
 
     # Start monitoring
     try:
         await tracker.start_monitoring()
     except KeyboardInterrupt:
-        print("\n👋 Monitoring stopped by user")
+        log.info("\n👋 Monitoring stopped by user")
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        log.error(f"❌ Fatal error: {e}")
+    finally:
+        await TONWalletTracker.shutdown()
 
 if __name__ == "__main__":
     # Install required packages:
-    # pip install websockets requests
+    # pip install websockets aiohttp orjson
+
+    listener = setup_logging()
 
-    print("TON Wallet Transaction Tracker")
-    print("Required packages: websockets, requests")
-    print("Install with: pip install websockets requests")
-    print()
+    log.info("TON Wallet Transaction Tracker")
+    log.info("Required packages: websockets, aiohttp, orjson")
+    log.info("Install with: pip install websockets aiohttp orjson")
+    log.info("")
 
-    asyncio.run(main())
+    try:
+        asyncio.run(main())
+    finally:
+        stop_logging(listener)